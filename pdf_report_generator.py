@@ -2,216 +2,547 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak, Flowable
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.ttfonts import TTFont, TTFError
+from reportlab.lib.utils import ImageReader
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+import io
 import os
+import re
 import logging
 from pathlib import Path
-from reportlab.graphics.shapes import Drawing, Rect, String
-from reportlab.graphics import renderPDF
-from reportlab.lib.colors import Color
+
+try:
+    # orjson parses raw report payloads several times faster when it is installed
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+_FONTS_READY = False
+
+
+def _ensure_fonts():
+    # Register fonts for currency symbol support. TTFont parses the whole
+    # file, so only try once per process and skip if already registered.
+    global _FONTS_READY
+    if _FONTS_READY:
+        return
+    try:
+        if 'DejaVuSans' not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont('DejaVuSans', 'static/fonts/DejaVuSans.ttf'))
+    except (TTFError, OSError) as e:
+        logging.warning("DejaVuSans font not found, using Helvetica: %s", e)
+    _FONTS_READY = True
+
+
+def _report_timestamp():
+    # Build the timestamp directly rather than through strftime's format parsing
+    dt = datetime.now()
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}_{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+
+
+def _build_styles(stylesheet, primary_color):
+    custom_styles = {}
+    
+    # Title style - keep original size for main header
+    custom_styles['Title'] = ParagraphStyle(
+        'CustomTitle',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica-Bold',
+        fontSize=24,
+        textColor=primary_color,
+        spaceAfter=0,
+        spaceBefore=6,
+        leading=28,
+        alignment=0
+    )
+    
+    # Subtitle style - keep original size for main header
+    custom_styles['Subtitle'] = ParagraphStyle(
+        'CustomSubtitle',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica',
+        fontSize=12,
+        textColor=colors.gray,
+        spaceAfter=0,
+        spaceBefore=2,
+        leading=14
+    )
+    
+    # Section Header style - adjust left indent
+    custom_styles['SectionHeader'] = ParagraphStyle(
+        'CustomSectionHeader',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica-Bold',
+        fontSize=10,
+        textColor=colors.black,
+        spaceBefore=0,
+        spaceAfter=4,
+        leading=12,
+        leftIndent=15,  # Reduced from 25 to 15 to move back two spaces
+        firstLineIndent=0,
+        alignment=0  # Left alignment
+    )
+    
+    # Subsection Header style - reduced size
+    custom_styles['SubsectionHeader'] = ParagraphStyle(
+        'CustomSubsectionHeader',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica',
+        fontSize=9,
+        textColor=colors.gray,
+        spaceBefore=6,
+        spaceAfter=4,
+        leading=11
+    )
+    return custom_styles
+
+
+_ZERO_PADDING_CMDS = (
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+)
+
+# Bound once so per-cell formatting skips the attribute lookup and concatenation
+_fmt_rs = "Rs. {:,}".format
+_fmt_num = "{:,}".format
+
+# Keys that identify market quote and damage observation dicts
+_QUOTE_KEYS = frozenset(('Dealer', 'Value'))
+_OBS_KEYS = frozenset(('Observation', 'Recommendation'))
+
+# Header rows of the section data tables; plain strings, bolded by the table style.
+# Table only writes back into flowable cells and spanned rows, so these all-string
+# rows can be shared by every table, even those built with normalizedData=1
+_DAMAGE_HEADER = ('Component', 'OBSERVATION', 'RECOMMENDATION')
+_KV_HEADER = ('Parameter', 'DETAILS')
+_DEALER_HEADER = ('Dealer', 'VALUE')
+
+# Matched against lowercased section keys
+_MONEY_RE = re.compile(r'cost|price|value|estimation')
+_IMAGE_RE = re.compile(r'vehicle details|vehicle dashboard|vehicle condition|stickers|signs')
+
+_GRID_CELL_CMDS = (
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
+)
+
+
+def _layout_table_style(align, valign, *extra_cmds):
+    """Borderless table used purely for positioning, with no cell padding"""
+    return TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), align),
+        ('VALIGN', (0, 0), (-1, -1), valign),
+        *_ZERO_PADDING_CMDS,
+        *extra_cmds,
+    ])
+
+
+def _grid_table_style(header_bg, *extra_cmds):
+    """Gridded data table with a shaded header row"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), header_bg),
+        *_GRID_CELL_CMDS,
+        *extra_cmds,
+    ])
+
+
+_LOGO_PATH = 'static/images/readyassist_logo.png'
+_QR_CODE_PATH = 'static/images/qr_code.png'
+
+
+@lru_cache(maxsize=8)
+def _cached_image_reader(path):
+    return ImageReader(path)
+
+
+@lru_cache(maxsize=128)
+def _row_band_cmds(num_rows, color):
+    # Gray BACKGROUND for the odd data rows (1, 3, 5, etc.). Absolute row commands
+    # keep that parity when a table splits across pages, where a ROWBACKGROUNDS
+    # cycle would restart on the continuation
+    return tuple(('BACKGROUND', (0, i), (-1, i), color) for i in range(1, num_rows, 2))
+
+
+def _cached_image(path, width, height):
+    # Image only accepts a filename, but it loads its ImageReader lazily into
+    # _img, so seed that with the shared reader and skip re-decoding the file
+    image = Image(path, width=width, height=height)
+    image._img = _cached_image_reader(path)
+    return image
+
+
+def _placeholder_drawing(width, height):
+    # Rendering sets canv/_parent on the Drawing and its shapes, so every draw
+    # gets its own instance rather than a shared, cached one
+    # reportlab.graphics is only needed here, so keep it off the import path
+    from reportlab.graphics.shapes import Drawing, Rect, String
+
+    # Create a rounded rectangle for the image placeholder with consistent size
+    d = Drawing(width, height)
+    
+    # Create a rounded rectangle with reduced corner radius
+    r = Rect(0, 0, width, height, rx=8, ry=8)  # Reduced corner radius from 15 to 8
+    r.fillColor = colors.Color(0.95, 0.95, 0.95)  # Light gray background
+    r.strokeColor = colors.Color(0.7, 0.7, 0.7)  # Gray border
+    r.strokeWidth = 1
+    
+    d.add(r)
+    
+    # Add placeholder text
+    s = String(width/2, height/2, "Image Placeholder", textAnchor="middle")
+    s.fontName = "Helvetica"
+    s.fontSize = 10
+    s.fillColor = colors.Color(0.5, 0.5, 0.5)  # Gray text
+    d.add(s)
+    
+    return d
+
+
+# Row builders for the hottest section loops: everything the loop body needs
+# is a local. Rows are plain lists of non-None cells, which is already the shape
+# Table normalises to, so data tables pass normalizedData=1 and Table keeps our
+# lists instead of copying every row. They must stay lists: Table writes the
+# processed Paragraph cells back into their row. The builders yield the
+# Paragraph rows rather than returning a list of them; _damage_rows still
+# collects its raw (component, observation, recommendation) strings first
+
+def _damage_rows(section_data, cell_style):
+    """Component/observation/recommendation Paragraph rows, skipping non-dict entries"""
+    rows = [
+        (component, details.get('Observation', 'N/A'), details.get('Recommendation', 'N/A'))
+        for component, details in section_data.items()
+        if isinstance(details, dict)
+    ]
+    P = Paragraph
+    return ([P(component, cell_style), P(observation, cell_style), P(recommendation, cell_style)]
+            for component, observation, recommendation in rows)
+
+
+def _key_value_rows(section_data, cell_style, format_value, is_money_section):
+    """Parameter/details rows; numbers are right-aligned currency in money sections"""
+    P = Paragraph
+    for key, value in section_data.items():
+        value_type = type(value)
+        # Determine if this is a boolean field
+        is_boolean = value_type is bool or key.lower() == 'same vehicle detected'
+        yield [
+            P(str(key), cell_style),
+            format_value(
+                value,
+                align_right=is_money_section and (value_type is int or value_type is float),
+                is_boolean=is_boolean
+            )
+        ]
+
+
+def _dict_list_rows(section_data, keys, format_value):
+    """One row per dict with a cell for every key, 'N/A' where a key is missing"""
+    for item in section_data:
+        get = item.get
+        row_data = []
+        cell = row_data.append
+        for k in keys:
+            value = get(k, 'N/A')
+            cell(format_value(value, is_boolean=value.__class__ is bool))
+        yield row_data
+
+
+class SectionKind(Enum):
+    """Table layout a top-level report section is rendered with"""
+    DAMAGE = 'damage'
+    KV_PLAIN = 'kv_plain'
+    KV_MONEY = 'kv_money'
+    KV_WITH_IMAGE = 'kv_with_image'
+    KV_MONEY_WITH_IMAGE = 'kv_money_with_image'
+    LIST_OF_DICTS = 'list_of_dicts'
+    SIMPLE_LIST = 'simple_list'
+
+
+def _key_value_kind(skey_l):
+    # Money and image placement for key/value sections follow the section name
+    is_money = _MONEY_RE.search(skey_l) is not None
+    if _IMAGE_RE.search(skey_l) is not None:
+        return SectionKind.KV_MONEY_WITH_IMAGE if is_money else SectionKind.KV_WITH_IMAGE
+    return SectionKind.KV_MONEY if is_money else SectionKind.KV_PLAIN
+
+
+class _LazyImagePlaceholder(Flowable):
+    """Fixed-size stand-in that only builds the placeholder Drawing when drawn"""
+
+    def __init__(self, width, height):
+        Flowable.__init__(self)
+        self.width = width
+        self.height = height
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        _placeholder_drawing(self.width, self.height).drawOn(self.canv, 0, 0)
+
 
 class VehicleDamageReportGenerator:
+    # Styles and colors are shared class attributes, so instances carry no state
+    __slots__ = ()
+
+    # Colors from HTML
+    PRIMARY_COLOR = colors.HexColor('#015386')  # ReadyAssist blue
+    HEADER_BG = colors.HexColor('#FAC61C')  # Light yellow - will be used for table headers
+    GRAY_BG = colors.HexColor('#F3F4F6')  # Light gray
+
+    # Styles are immutable once built, so every instance shares one set
+    stylesheet = getSampleStyleSheet()
+    styles = stylesheet['Normal'].clone('CustomNormal')  # Clone with a name
+    _CUSTOM_STYLES = _build_styles(stylesheet, PRIMARY_COLOR)
+
+    # Section header carrying the small gap before the section's table
+    _SECTION_HEADER_STYLE = ParagraphStyle(
+        'SectionHeaderSpaced',
+        parent=_CUSTOM_STYLES['SectionHeader'],
+        spaceAfter=8  # SectionHeader's 4 plus the 4 the old Spacer added
+    )
+
+    # Section header with reduced left indent for specific sections
+    _SPECIAL_HEADER_STYLE = ParagraphStyle(
+        'SpecialSectionHeader',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica-Bold',
+        fontSize=10,
+        textColor=colors.black,
+        spaceBefore=0,
+        spaceAfter=8,  # Increased from 4 to 8
+        leading=12,
+        leftIndent=8,  # Reduced indent for these specific sections
+        firstLineIndent=0,
+        alignment=0
+    )
+
+    # Bold, black variant of the SubsectionHeader custom style
+    _SUBSECTION_HEADER_STYLE = ParagraphStyle(
+        'SubsectionHeader',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica-Bold',
+        fontSize=9,
+        textColor=colors.black,
+        spaceBefore=6,
+        spaceAfter=4,
+        leading=11
+    )
+
+    # Table cell styles
+    _CELL8_CJK = ParagraphStyle('Cell8CJK', parent=stylesheet['Normal'], fontSize=8, wordWrap='CJK')
+    _DEALER_STYLE = ParagraphStyle('Dealer', parent=stylesheet['Normal'], fontSize=10, wordWrap='CJK')
+    # Generic cell styles indexed by alignment (0=left, 1=center, 2=right)
+    _CELL_STYLES = (
+        ParagraphStyle('CellStyle', parent=stylesheet['Normal'], fontSize=8, wordWrap='CJK', alignment=0),
+        ParagraphStyle('CellStyle', parent=stylesheet['Normal'], fontSize=8, wordWrap='CJK', alignment=1),
+        ParagraphStyle('CellStyle', parent=stylesheet['Normal'], fontSize=8, wordWrap='CJK', alignment=2),
+    )
+    _cell_style, _cell_style_centered = _CELL_STYLES[0], _CELL_STYLES[1]
+    # Style for the consistency check reason text that handles wrapping
+    _REASON_STYLE = ParagraphStyle('Reason', parent=stylesheet['Normal'], fontSize=10, wordWrap='CJK', alignment=0)
+    _COST_STYLE = ParagraphStyle(
+        'Cost',
+        parent=stylesheet['Normal'],
+        fontSize=8,
+        fontName='Helvetica',
+        alignment=2  # Right alignment
+    )
+
+    _YES_NO = ('No', 'Yes')  # Indexed by bool
+
+    # Market valuation rows, in display order; keys double as row labels
+    _VALUATION_KEYS = ('Pre-Accident Value', 'Post-Accident Value', 'Salvage Value', 'Estimated Value After Repairs')
+
+    # Header styles
+    _LOGO_STYLE = ParagraphStyle(
+        'Logo',
+        parent=stylesheet['Normal'],
+        fontSize=18,
+        textColor=colors.black,
+        fontName='Helvetica-Bold',
+        leading=18,
+        spaceBefore=0,
+        spaceAfter=0
+    )
+    _QR_FALLBACK_STYLE = ParagraphStyle(
+        'QR',
+        parent=stylesheet['Normal'],
+        fontSize=10,
+        textColor=colors.black,
+        fontName='Helvetica',
+        alignment=1
+    )
+    _HEADER_TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica-Bold',
+        fontSize=20,
+        textColor=PRIMARY_COLOR,
+        leading=24,  # Increased leading
+        spaceBefore=0,
+        spaceAfter=6  # Added spaceAfter
+    )
+    _HEADER_SUBTITLE_STYLE = ParagraphStyle(
+        'CustomSubtitle',
+        parent=stylesheet['Normal'],
+        fontName='Helvetica',
+        fontSize=10,
+        textColor=colors.gray,
+        leading=14,  # Increased leading
+        spaceBefore=4,  # Added spaceBefore
+        spaceAfter=0
+    )
+
+    # Footer styles; the footer Paragraphs themselves carry layout state, so
+    # they are built per report in _footer_lines
+    _FOOTER_COMPANY_STYLE = ParagraphStyle(
+        'FooterCompany',
+        parent=stylesheet['Normal'],
+        fontSize=8,
+        fontName='Helvetica-Bold'
+    )
+    _FOOTER_ADDRESS_STYLE = ParagraphStyle(
+        'FooterAddress',
+        parent=stylesheet['Normal'],
+        fontSize=8,
+        fontName='Helvetica',
+        textColor=colors.gray
+    )
+    _FOOTER_LINK_STYLE = ParagraphStyle(
+        'FooterLink',
+        parent=stylesheet['Normal'],
+        fontSize=8,
+        textColor=colors.blue,
+        fontName='Helvetica'
+    )
+    _PAGE_NUMBER_STYLE = ParagraphStyle(
+        'PageNumber',
+        parent=stylesheet['Normal'],
+        fontSize=8,
+        fontName='Helvetica',
+        alignment=2  # Right alignment
+    )
+
+    # Shared commands for _get_table_style
+    _BASE_STYLE_CMDS = (
+        ('BACKGROUND', (0, 0), (-1, 0), HEADER_BG),  # Header row background (yellow)
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ('LEFTPADDING', (0, 0), (-1, -1), 4),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+        # Add visible border between headings (keep grey separator)
+        ('LINEBEFORE', (1, 0), (1, 0), 0.5, colors.HexColor('#B0B0B0')),
+        # Add yellow border around the heading row
+        ('BOX', (0, 0), (-1, 0), 1.0, HEADER_BG),
+        # Add grid lines for all other rows
+        ('GRID', (0, 1), (-1, -1), 0.3, colors.HexColor('#B0B0B0')),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    )
+
+    # Table styles are static per table kind, so parse them once
+    _ZERO_PAD_CENTER_STYLE = _layout_table_style('CENTER', 'MIDDLE')
+    _HEADING_TABLE_STYLE = _layout_table_style('LEFT', 'MIDDLE', ('BOTTOMPADDING', (0, 0), (-1, -1), 4))
+    _HEADER_TABLE_STYLE = TableStyle([
+        ('SPAN', (0, 1), (-1, 1)),  # Span title across all columns
+        ('SPAN', (0, 2), (-1, 2)),  # Span subtitle across all columns
+        ('ALIGN', (0, 0), (1, -1), 'LEFT'),
+        ('ALIGN', (-1, 0), (-1, 0), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        *_ZERO_PADDING_CMDS,
+        ('TOPPADDING', (1, 0), (1, 0), (0.3*inch - 18) / 2),  # Center company name against the logo
+    ])
+    _HEADER_TABLE_NO_LOGO_STYLE = TableStyle(
+        [('SPAN', (0, 0), (1, 0)), ('TOPPADDING', (0, 0), (0, 0), 0)],
+        parent=_HEADER_TABLE_STYLE
+    )
+    _DATA_TABLE_STYLE = _grid_table_style(HEADER_BG, ('WORDWRAP', (0, 0), (-1, -1), True))
+    _DAMAGE_TABLE_STYLE = _grid_table_style(HEADER_BG)
+    _REPAIR_TABLE_STYLE = _grid_table_style(
+        GRAY_BG,
+        ('BACKGROUND', (0, -1), (-1, -1), GRAY_BG),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    )
+    _VALUATION_TABLE_STYLE = _grid_table_style(GRAY_BG, ('ALIGN', (1, 0), (1, -1), 'RIGHT'))
+    _CONSISTENCY_TABLE_STYLE = _grid_table_style(GRAY_BG, ('VALIGN', (0, 0), (-1, -1), 'TOP'))
+    # Data table and image placeholder side by side, 0.2in apart
+    _LAYOUT_TABLE_STYLE = _layout_table_style('LEFT', 'TOP', ('LEFTPADDING', (1, 0), (1, 0), 0.2*inch))
+    _FOOTER_INNER_STYLE = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+    ])
+    _FOOTER_OUTER_STYLE = TableStyle([
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('ALIGN', (-1, -1), (-1, -1), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'BOTTOM'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 30),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 30),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ])
+
     def __init__(self):
-        self.stylesheet = getSampleStyleSheet()
-        self.styles = self.stylesheet['Normal'].clone('CustomNormal')  # Clone with a name
-        self._setup_custom_styles()
-        
-    def _setup_custom_styles(self):
-        # Register fonts for currency symbol support
+        _ensure_fonts()
+
+    def _create_header(self):
+        # Logo, company name and QR code sit in the first row of a single
+        # table; the title and subtitle rows span its full width
+        header_style = self._HEADER_TABLE_STYLE
         try:
-            pdfmetrics.registerFont(TTFont('DejaVuSans', 'static/fonts/DejaVuSans.ttf'))
-        except:
-            logging.warning("DejaVuSans font not found, using Helvetica")
-        
-        # Colors from HTML
-        self.PRIMARY_COLOR = colors.HexColor('#015386')  # ReadyAssist blue
-        self.HEADER_BG = colors.HexColor('#FAC61C')  # Light yellow - will be used for table headers
-        self.GRAY_BG = colors.HexColor('#F3F4F6')  # Light gray
-        
-        # Create custom styles
-        self.custom_styles = {}
-        
-        # Title style - keep original size for main header
-        self.custom_styles['Title'] = ParagraphStyle(
-            'CustomTitle',
-            parent=self.stylesheet['Normal'],
-            fontName='Helvetica-Bold',
-            fontSize=24,
-            textColor=self.PRIMARY_COLOR,
-            spaceAfter=0,
-            spaceBefore=6,
-            leading=28,
-            alignment=0
-        )
-        
-        # Subtitle style - keep original size for main header
-        self.custom_styles['Subtitle'] = ParagraphStyle(
-            'CustomSubtitle',
-            parent=self.stylesheet['Normal'],
-            fontName='Helvetica',
-            fontSize=12,
-            textColor=colors.gray,
-            spaceAfter=0,
-            spaceBefore=2,
-            leading=14
-        )
-        
-        # Section Header style - adjust left indent
-        self.custom_styles['SectionHeader'] = ParagraphStyle(
-            'CustomSectionHeader',
-            parent=self.stylesheet['Normal'],
-            fontName='Helvetica-Bold',
-            fontSize=10,
-            textColor=colors.black,
-            spaceBefore=0,
-            spaceAfter=4,
-            leading=12,
-            leftIndent=15,  # Reduced from 25 to 15 to move back two spaces
-            firstLineIndent=0,
-            alignment=0  # Left alignment
-        )
-        
-        # Subsection Header style - reduced size
-        self.custom_styles['SubsectionHeader'] = ParagraphStyle(
-            'CustomSubsectionHeader',
-            parent=self.stylesheet['Normal'],
-            fontName='Helvetica',
-            fontSize=9,
-            textColor=colors.gray,
-            spaceBefore=6,
-            spaceAfter=4,
-            leading=11
-        )
+            logo_cells = [
+                _cached_image(_LOGO_PATH, width=0.3*inch, height=0.3*inch),
+                Paragraph("ReadyAssist", self._LOGO_STYLE)
+            ]
+        except OSError:
+            logo_cells = [Paragraph("ReadyAssist", self._LOGO_STYLE), '']
+            header_style = self._HEADER_TABLE_NO_LOGO_STYLE
 
-    def _create_header(self, story):
         # QR code without box and text
         try:
-            qr_code = Image("static/images/qr_code.png", width=0.8*inch, height=0.8*inch)
-            qr_table = Table(
-                [[qr_code]],
-                colWidths=[0.8*inch],
-                style=TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                ])
-            )
-        except:
+            qr_code = _cached_image(_QR_CODE_PATH, width=0.8*inch, height=0.8*inch)
+        except OSError:
             # Fallback if QR code image is not found
             logging.warning("QR code image not found, using text placeholder")
-            qr_table = Table(
-                [[Paragraph("QR", 
-                         ParagraphStyle('QR',
-                                      parent=self.stylesheet['Normal'],
-                                      fontSize=10,
-                                      textColor=colors.black,
-                                      fontName='Helvetica',
-                                      alignment=1))]],
-                colWidths=[0.8*inch],
-                style=TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                ])
-            )
-
-        # Logo and company name
-        try:
-            logo_row = Table(
-                [[
-                    Image("static/images/readyassist_logo.png", width=0.3*inch, height=0.3*inch),
-                    Paragraph("ReadyAssist", 
-                            ParagraphStyle('Logo', 
-                                         parent=self.stylesheet['Normal'],
-                                         fontSize=18,
-                                         textColor=colors.black,
-                                         fontName='Helvetica-Bold',
-                                         leading=18,
-                                         spaceBefore=0,
-                                         spaceAfter=0))
-                ]],
-                colWidths=[0.35*inch, 2*inch],
-                style=TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                ])
-            )
-        except:
-            logo_row = Table(
-                [[Paragraph("ReadyAssist", 
-                          ParagraphStyle('Logo', 
-                                       parent=self.stylesheet['Normal'],
-                                       fontSize=18,
-                                       textColor=colors.black,
-                                       fontName='Helvetica-Bold',
-                                       leading=18,
-                                       spaceBefore=0,
-                                       spaceAfter=0))]],
-                colWidths=[2.35*inch],
-                style=TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                ])
-            )
+            qr_code = Paragraph("QR", self._QR_FALLBACK_STYLE)
 
-        # Create header content in a single table for better control
         header_content = [
-            [logo_row, qr_table],  # Changed claims_box to qr_table
-            [Paragraph("Comprehensive Vehicle Report", 
-                      ParagraphStyle('CustomTitle',
-                                   parent=self.stylesheet['Normal'],
-                                   fontName='Helvetica-Bold',
-                                   fontSize=20,
-                                   textColor=colors.HexColor('#015386'),
-                                   leading=24,  # Increased leading
-                                   spaceBefore=0,
-                                   spaceAfter=6)), ''],  # Added spaceAfter
-            [Paragraph("A system generated report by AI operated Impact Analysis system", 
-                      ParagraphStyle('CustomSubtitle',
-                                   parent=self.stylesheet['Normal'],
-                                   fontName='Helvetica',
-                                   fontSize=10,
-                                   textColor=colors.gray,
-                                   leading=14,  # Increased leading
-                                   spaceBefore=4,  # Added spaceBefore
-                                   spaceAfter=0)), '']
+            logo_cells + [qr_code],
+            [Paragraph("Comprehensive Vehicle Report", self._HEADER_TITLE_STYLE), '', ''],
+            [Paragraph("A system generated report by AI operated Impact Analysis system",
+                       self._HEADER_SUBTITLE_STYLE), '', '']
         ]
 
         # Create the main header table with adjusted row heights
         header_table = Table(
             header_content,
-            colWidths=[5.8*inch, 1.2*inch],
+            colWidths=[0.35*inch, 5.45*inch, 1.2*inch],
             rowHeights=[0.4*inch, 0.35*inch, 0.25*inch],  # Increased heights for title and subtitle rows
-            style=TableStyle([
-                ('SPAN', (0, 1), (1, 1)),  # Span title across both columns
-                ('SPAN', (0, 2), (1, 2)),  # Span subtitle across both columns
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ])
+            style=header_style
         )
         
-        story.append(header_table)
-        story.append(Spacer(1, 15))  # Reduced spacing after header
+        yield header_table
+        yield Spacer(1, 15)  # Reduced spacing after header
 
     def _create_table_with_image(self, title, data, should_add_image_placeholder=False):
         elements = []
@@ -221,102 +552,55 @@ class VehicleDamageReportGenerator:
             main_table = Table(
                 data,
                 colWidths=[2.5*inch, 4.5*inch],
-                style=TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), self.HEADER_BG),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 2),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-                    ('WORDWRAP', (0, 0), (-1, -1), True),
-                ])
+                style=self._DATA_TABLE_STYLE,
+                hAlign='LEFT'
             )
             
             # Create the heading table with consistent left margin
             heading_table = Table(
-                [[Paragraph(title, self.custom_styles['SectionHeader'])]],
+                [[Paragraph(title, self._CUSTOM_STYLES['SectionHeader'])]],
                 colWidths=[7*inch],
-                style=TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                ])
-            )
-            
-            # Create a container for content with consistent left margin
-            container = Table(
-                [[heading_table], [main_table]],
-                style=TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                ])
+                style=self._HEADING_TABLE_STYLE,
+                hAlign='LEFT'
             )
             
-            elements.append(container)
+            elements.append(heading_table)
+            elements.append(main_table)
             elements.append(Spacer(1, 8))
             
         return elements
 
-    def _create_damage_analysis_section(self, story, data):
+    def _create_damage_analysis_section(self, data):
         # Create section header with consistent margin
-        story.append(Paragraph("Damage Analysis", self.custom_styles['SectionHeader']))
-        story.append(Spacer(1, 4))  # Add a small spacer after the header
-        damage_data = []
-        damage_data.append(['Component', 'OBSERVATION', 'RECOMMENDATION'])
+        yield Paragraph("Damage Analysis", self._CUSTOM_STYLES['SectionHeader'])
+        yield Spacer(1, 4)  # Add a small spacer after the header
+        damage_data = [_DAMAGE_HEADER]
         
         damage_analysis = data.get('Damage Analysis', {})
-        for component, details in damage_analysis.items():
-            damage_data.append([
-                Paragraph(component, ParagraphStyle('Component', 
-                                                  parent=self.stylesheet['Normal'],
-                                                  fontSize=8,
-                                                  wordWrap='CJK')),
-                Paragraph(details.get('Observation', 'N/A'), ParagraphStyle('Observation',
-                                                                          parent=self.stylesheet['Normal'],
-                                                                          fontSize=8,
-                                                                          wordWrap='CJK')),
-                Paragraph(details.get('Recommendation', 'N/A'), ParagraphStyle('Recommendation',
-                                                                             parent=self.stylesheet['Normal'],
-                                                                             fontSize=8,
-                                                                             wordWrap='CJK'))
-            ])
+        cell_style = self._CELL8_CJK
+        damage_data.extend(
+            [
+                Paragraph(component, cell_style),
+                Paragraph(details.get('Observation', 'N/A'), cell_style),
+                Paragraph(details.get('Recommendation', 'N/A'), cell_style)
+            ]
+            for component, details in damage_analysis.items()
+        )
         
         # Create a table without space for image
         damage_table = Table(
             damage_data,
             colWidths=[2.3*inch, 2.3*inch, 2.4*inch],  # Adjusted for full width
-            style=TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), self.HEADER_BG),  # Changed from GRAY_BG to HEADER_BG
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 2),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-            ])
+            style=self._DAMAGE_TABLE_STYLE
         )
         
-        story.append(damage_table)
-        story.append(Spacer(1, 8))
+        yield damage_table
+        yield Spacer(1, 8)
 
-    def _create_repair_costs_section(self, story, data):
+    def _create_repair_costs_section(self, data):
         # Add page break before repair costs section
-        story.append(PageBreak())
-        story.append(Paragraph("Repair Cost Estimation", self.custom_styles['SectionHeader']))
+        yield PageBreak()
+        yield Paragraph("Repair Cost Estimation", self._CUSTOM_STYLES['SectionHeader'])
         
         repair_costs = data.get('Repair Cost Estimation (INR)', {})
         if not repair_costs:
@@ -324,149 +608,73 @@ class VehicleDamageReportGenerator:
             
         repair_data = [['Component', 'COST']]
         
-        cost_style = ParagraphStyle(
-            'Cost',
-            parent=self.stylesheet['Normal'],
-            fontSize=8,
-            fontName='Helvetica',
-            alignment=2
+        # Add all components except Total Repair Cost. Costs are plain strings;
+        # the table style already right-aligns the cost column
+        repair_data.extend(
+            [component, _fmt_rs(cost) if isinstance(cost, (int, float)) else str(cost)]
+            for component, cost in repair_costs.items()
+            if component != 'Total Repair Cost'
         )
         
-        # Add all components except Total Repair Cost
-        for component, cost in repair_costs.items():
-            if component != 'Total Repair Cost':
-                repair_data.append([
-                    component,
-                    Paragraph("Rs. " + "{:,}".format(cost) if isinstance(cost, (int, float)) else str(cost), cost_style)
-                ])
-        
         # Add Total Repair Cost at the end if it exists
         if 'Total Repair Cost' in repair_costs:
-            repair_data.append([
-                'Total Repair Cost',
-                Paragraph("Rs. " + "{:,}".format(repair_costs['Total Repair Cost']), cost_style)
-            ])
+            repair_data.append(['Total Repair Cost', _fmt_rs(repair_costs['Total Repair Cost'])])
         
         # Create repair costs table with full width
         if len(repair_data) > 1:  # Only create table if we have data
             repair_table = Table(
                 repair_data,
                 colWidths=[5.5*inch, 1.5*inch],
-                style=TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), self.GRAY_BG),
-                    ('BACKGROUND', (0, -1), (-1, -1), self.GRAY_BG),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 2),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-                ])
+                style=self._REPAIR_TABLE_STYLE
             )
-            story.append(repair_table)
-            story.append(Spacer(1, 8))
+            yield repair_table
+            yield Spacer(1, 8)
 
-    def _create_market_valuation_section(self, story, data):
-        story.append(Paragraph("Market Valuation", self.custom_styles['SectionHeader']))
-        
-        # Create cost style for rupee values
-        cost_style = ParagraphStyle(
-            'Cost',
-            parent=self.stylesheet['Normal'],
-            fontSize=8,
-            fontName='Helvetica',
-            alignment=2  # Right alignment
-        )
+    def _create_market_valuation_section(self, data):
+        yield Paragraph("Market Valuation", self._CUSTOM_STYLES['SectionHeader'])
         
         # Main valuation table - dynamically create rows based on available data
         market_valuation = data.get('Market Valuation (INR)', {})
         valuation_data = [['Parameter', 'VALUE']]
         
-        # Map of possible keys to their display names
-        value_keys = {
-            'Pre-Accident Value': 'Pre-Accident Value',
-            'Post-Accident Value': 'Post-Accident Value',
-            'Salvage Value': 'Salvage Value',
-            'Estimated Value After Repairs': 'Estimated Value After Repairs'
-        }
-        
         # Only add rows for values that exist in the data
-        for key, display_name in value_keys.items():
+        for key in self._VALUATION_KEYS:
             if key in market_valuation:
-                valuation_data.append([
-                    display_name,
-                    Paragraph("Rs. " + "{:,}".format(market_valuation.get(key, 0)), cost_style)
-                ])
+                valuation_data.append([key, _fmt_rs(market_valuation[key])])
         
         if valuation_data:  # Only create table if we have data
             valuation_table = Table(
                 valuation_data,
                 colWidths=[4.5*inch, 2.5*inch],
-                style=TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), self.GRAY_BG),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 2),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-                ])
+                style=self._VALUATION_TABLE_STYLE
             )
-            story.append(valuation_table)
-            story.append(Spacer(1, 4))
+            yield valuation_table
+            yield Spacer(1, 4)
         
         # Market Quotes section - only add if quotes exist
         if market_valuation.get('Market Quotes'):
-            story.append(Paragraph("Market Quotes", ParagraphStyle('SubsectionHeader',
-                                                                parent=self.stylesheet['Normal'],
-                                                                fontName='Helvetica-Bold',
-                                                                fontSize=9,
-                                                                textColor=colors.black,
-                                                                spaceBefore=6,
-                                                                spaceAfter=4,
-                                                                leading=11)))
-            quotes_data = [['Dealer', 'VALUE']]
-            for quote in market_valuation.get('Market Quotes', []):
-                if 'Dealer' in quote and 'Value' in quote:  # Only add complete quote entries
-                    quotes_data.append([
-                        Paragraph(quote.get('Dealer', 'N/A'), ParagraphStyle('Dealer',
-                                                                        parent=self.stylesheet['Normal'],
-                                                                        fontSize=10,
-                                                                        wordWrap='CJK')),
-                        Paragraph("Rs. " + "{:,}".format(quote.get('Value', 0)), cost_style)
-                    ])
+            yield Paragraph("Market Quotes", self._SUBSECTION_HEADER_STYLE)
+            quotes_data = [_DEALER_HEADER]
+            dealer_style, cost_style = self._DEALER_STYLE, self._COST_STYLE
+            quotes_data.extend(
+                [
+                    Paragraph(quote.get('Dealer', 'N/A'), dealer_style),
+                    Paragraph(_fmt_rs(quote.get('Value', 0)), cost_style)
+                ]
+                for quote in market_valuation.get('Market Quotes', [])
+                if _QUOTE_KEYS <= quote.keys()  # Only add complete quote entries
+            )
             
             if len(quotes_data) > 1:  # Only create table if we have quotes
                 quotes_table = Table(
                     quotes_data,
                     colWidths=[4.5*inch, 2.5*inch],
-                    style=TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), self.GRAY_BG),
-                        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 8),
-                        ('TOPPADDING', (0, 0), (-1, -1), 2),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-                    ])
+                    style=self._VALUATION_TABLE_STYLE
                 )
-                story.append(quotes_table)
-                story.append(Spacer(1, 4))
+                yield quotes_table
+                yield Spacer(1, 4)
 
-    def _create_image_placeholders_grid(self, story):
+    def _create_image_placeholders_grid(self):
         """Create a 2x2 grid of image placeholders with proper spacing and consistent styling"""
         # Calculate dimensions for larger placeholders
         # Make each placeholder about half the table width (7 inches) minus spacing
@@ -478,347 +686,339 @@ class VehicleDamageReportGenerator:
         def create_grid_placeholder():
             return self._create_image_placeholder(placeholder_width, placeholder_height)
         
-        # Create the top row with two placeholders and spacing
-        top_row = Table(
-            [[
-                create_grid_placeholder(),
-                Spacer(spacing, spacing),
-                create_grid_placeholder()
-            ]],
+        # One 3x3 table; the empty middle row and column provide the spacing
+        grid = Table(
+            [
+                [create_grid_placeholder(), None, create_grid_placeholder()],
+                [None, None, None],
+                [create_grid_placeholder(), None, create_grid_placeholder()]
+            ],
             colWidths=[placeholder_width, spacing, placeholder_width],
-            style=TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ])
-        )
-        
-        # Create the bottom row with two placeholders and spacing
-        bottom_row = Table(
-            [[
-                create_grid_placeholder(),
-                Spacer(spacing, spacing),
-                create_grid_placeholder()
-            ]],
-            colWidths=[placeholder_width, spacing, placeholder_width],
-            style=TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ])
-        )
-        
-        # Create a container table to center the grid on the page
-        grid_container = Table(
-            [[top_row], [Spacer(1, spacing)], [bottom_row]],
-            style=TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 25),  # Add left margin to center with table
-                ('RIGHTPADDING', (0, 0), (-1, -1), 25),  # Add right margin to center with table
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ])
+            rowHeights=[placeholder_height, spacing, placeholder_height],
+            style=self._ZERO_PAD_CENTER_STYLE
         )
         
         # Add some space before the grid
-        story.append(Spacer(1, 15))
+        yield Spacer(1, 15)
         
-        # Add the centered grid container
-        story.append(grid_container)
+        # Add the centered grid
+        yield grid
         
         # Add some space after the grid
-        story.append(Spacer(1, 15))
+        yield Spacer(1, 15)
 
-    def _create_consistency_check_section(self, story, data):
-        story.append(Paragraph("Vehicle Consistency Check", self.custom_styles['SectionHeader']))
+    def _create_consistency_check_section(self, data):
+        yield Paragraph("Vehicle Consistency Check", self._CUSTOM_STYLES['SectionHeader'])
         consistency_check = data.get('Vehicle Consistency Check', {})
         
-        # Create a style for the reason text that handles wrapping
-        reason_style = ParagraphStyle(
-            'Reason',
-            parent=self.stylesheet['Normal'],
-            fontSize=10,
-            wordWrap='CJK',
-            alignment=0
-        )
-        
         consistency_data = [
-            ['Parameter', 'DETAILS'],
-            ['Same Vehicle Detected', 'Yes' if consistency_check.get('Same Vehicle Detected', False) else 'No'],
-            ['Reason', Paragraph(consistency_check.get('Reason', 'N/A'), reason_style)]
+            _KV_HEADER,
+            ['Same Vehicle Detected', self._YES_NO[bool(consistency_check.get('Same Vehicle Detected', False))]],
+            ['Reason', Paragraph(consistency_check.get('Reason', 'N/A'), self._REASON_STYLE)]
         ]
         
         consistency_table = Table(
             consistency_data,
             colWidths=[3*inch, 4*inch],  # Adjusted for full width
-            style=TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), self.GRAY_BG),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 2),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ])
-        )
-        story.append(consistency_table)
-        story.append(Spacer(1, 12))
-
-    def _get_cell_style(self, alignment=0):
-        """Get cell style with proper word wrapping
-        alignment: 0=left, 1=center, 2=right"""
-        return ParagraphStyle(
-            'CellStyle',
-            parent=self.stylesheet['Normal'],
-            fontSize=8,
-            wordWrap='CJK',
-            alignment=alignment
+            style=self._CONSISTENCY_TABLE_STYLE
         )
+        yield consistency_table
+        yield Spacer(1, 12)
 
     def _format_value(self, value, align_right=False, is_boolean=False):
         """Format a value for display in a table cell"""
+        # Dispatch on the exact type first: bool subclasses int, so an isinstance
+        # chain would send booleans to the number formatter
+        handler = self._FORMATTERS.get((type(value), align_right, is_boolean))
+        if handler is not None:
+            return handler(self, value)
         if is_boolean:
-            # Handle boolean values
-            formatted = "Yes" if value else "No"
-            return Paragraph(formatted, self._get_cell_style())
-        elif isinstance(value, (int, float)):
-            # Only format as currency if it's in a money context
-            if align_right:
-                formatted = "Rs. {:,}".format(value)
+            return self._format_bool(value)
+        # Subclasses (e.g. OrderedDict from an object_pairs_hook) miss the exact lookup
+        if isinstance(value, dict):
+            return self._format_dict(value)
+        if isinstance(value, list):
+            return self._format_list(value)
+        if isinstance(value, (int, float)):
+            return self._format_money(value) if align_right else self._format_plain_number(value)
+        return self._format_str(value)
+
+    def _format_bool(self, value):
+        # Handle boolean values
+        formatted = "Yes" if value else "No"
+        return Paragraph(formatted, self._cell_style)
+
+    def _format_money(self, value):
+        # Only used in a money context (right-aligned cells)
+        return Paragraph(_fmt_rs(value), self._CELL_STYLES[2])
+
+    def _format_plain_number(self, value):
+        return Paragraph(_fmt_num(value), self._cell_style)
+
+    def _format_list(self, value):
+        # Handle list values
+        if all(isinstance(item, dict) for item in value):
+            # For list of dictionaries (e.g., market quotes), format each dict;
+            # other dictionary items are formatted as key-value pairs
+            formatted = "\n".join(
+                f"{item['Dealer']}: Rs. {item['Value']:,}" if _QUOTE_KEYS <= item.keys()
+                else ", ".join(
+                    f"{k}: {'Yes' if v else 'No'}" if isinstance(v, bool) else f"{k}: {v}"
+                    for k, v in item.items()
+                )
+                for item in value
+            )
+        else:
+            # For simple lists, join with commas
+            formatted = ", ".join(str(item) for item in value)
+        return Paragraph(formatted, self._cell_style)
+
+    def _format_dict(self, value):
+        # Handle dictionary values
+        if _QUOTE_KEYS <= value.keys():
+            # Special handling for market quote dictionaries
+            formatted = f"{value['Dealer']}: Rs. {value['Value']:,}"
+        elif value.keys() & _OBS_KEYS:
+            # Return the raw dictionary for observation/recommendation pairs
+            return value
+        else:
+            # For other dictionaries, format each key-value pair
+            formatted_pairs = []
+            for k, v in value.items():
+                if isinstance(v, bool):
+                    formatted_pairs.append(f"{k}: {'Yes' if v else 'No'}")
+                elif isinstance(v, (int, float)) and any(word in k.lower() for word in ['cost', 'price', 'value']):
+                    formatted_pairs.append(f"{k}: Rs. {v:,}")
+                else:
+                    formatted_pairs.append(f"{k}: {v}")
+            formatted = "\n".join(formatted_pairs)
+        return Paragraph(formatted, self._cell_style)
+
+    def _format_str(self, value):
+        # Convert to string and wrap in Paragraph
+        return Paragraph(str(value), self._cell_style)
+
+    # Exact (type, align_right, is_boolean) combinations, which cover nearly every
+    # cell; anything else (subclasses, is_boolean on a non-bool) takes the
+    # isinstance checks in _format_value
+    _FORMATTERS = {
+        (str, False, False): _format_str,
+        (int, False, False): _format_plain_number,
+        (float, False, False): _format_plain_number,
+        (int, True, False): _format_money,
+        (float, True, False): _format_money,
+        (bool, False, False): _format_bool,
+        (bool, False, True): _format_bool,
+        (bool, True, False): _format_bool,
+        (bool, True, True): _format_bool,
+        (list, False, False): _format_list,
+        (list, True, False): _format_list,
+        (dict, False, False): _format_dict,
+        (dict, True, False): _format_dict,
+    }
+
+    def _emit_damage_section(self, section_data):
+        # Create damage analysis table with three columns
+        table_data = [_DAMAGE_HEADER]
+        table_data.extend(_damage_rows(section_data, self._cell_style))
+        if len(table_data) > 1:
+            yield Table(
+                table_data,
+                colWidths=[2.3*inch, 2.3*inch, 2.4*inch],
+                style=self._get_table_style(has_money=False, num_rows=len(table_data)),
+                normalizedData=1
+            )
+
+    def _key_value_table(self, section_data, is_money_section, with_image):
+        # Standard key-value pairs
+        table_data = [_KV_HEADER]
+        table_data.extend(_key_value_rows(section_data, self._cell_style, self._format_value, is_money_section))
+        
+        if len(table_data) > 1:
+            if with_image:
+                # Create a layout table with proper spacing
+                yield Table(
+                    [[
+                        Table(
+                            table_data,
+                            colWidths=[2.5*inch, 2.5*inch],
+                            style=self._get_table_style(has_money=is_money_section, num_rows=len(table_data)),
+                            normalizedData=1
+                        ),
+                        self._create_image_placeholder()
+                    ]],
+                    colWidths=[5*inch, 2.2*inch],
+                    style=self._LAYOUT_TABLE_STYLE
+                )
             else:
-                formatted = "{:,}".format(value)
-            return Paragraph(formatted, self._get_cell_style(alignment=2 if align_right else 0))
-        elif isinstance(value, bool):
-            # Handle boolean values
-            formatted = "Yes" if value else "No"
-            return Paragraph(formatted, self._get_cell_style())
-        elif isinstance(value, list):
-            # Handle list values
-            if all(isinstance(item, dict) for item in value):
-                # For list of dictionaries (e.g., market quotes), format each dict
-                formatted_items = []
-                for item in value:
-                    if 'Dealer' in item and 'Value' in item:
-                        formatted_items.append(f"{item['Dealer']}: Rs. {item['Value']:,}")
+                # Create table with full width for sections without image placeholders
+                yield Table(
+                    table_data,
+                    colWidths=[3*inch, 4*inch],
+                    style=self._get_table_style(has_money=is_money_section, num_rows=len(table_data)),
+                    normalizedData=1
+                )
+
+    def _emit_kv_plain(self, section_data):
+        return self._key_value_table(section_data, is_money_section=False, with_image=False)
+
+    def _emit_kv_money(self, section_data):
+        return self._key_value_table(section_data, is_money_section=True, with_image=False)
+
+    def _emit_kv_with_image(self, section_data):
+        return self._key_value_table(section_data, is_money_section=False, with_image=True)
+
+    def _emit_kv_money_with_image(self, section_data):
+        return self._key_value_table(section_data, is_money_section=True, with_image=True)
+
+    def _emit_list_of_dicts(self, section_data):
+        # List of dictionaries (e.g., market quotes)
+        if section_data and 'Dealer' in section_data[0]:
+            cell_style = self._cell_style
+            money_style = self._CELL_STYLES[2]
+            format_value = self._format_value
+            table_data = [_DEALER_HEADER]
+            for item in section_data:
+                value = item.get('Value', 0)
+                table_data.append([
+                    Paragraph(str(item.get('Dealer', 'N/A')), cell_style),
+                    # Numeric values are the norm; format them without the dispatch
+                    Paragraph(_fmt_rs(value), money_style) if type(value) in (int, float)
+                    else format_value(value, align_right=True)
+                ])
+        else:
+            # Generic list of dictionaries
+            # Columns in first-seen order, collected in one pass
+            keys = list(dict.fromkeys(k for d in section_data for k in d))
+            cell_style_centered = self._cell_style_centered
+            table_data = [[Paragraph(k.upper(), cell_style_centered) for k in keys]]
+            table_data.extend(_dict_list_rows(section_data, keys, self._format_value))
+        yield from self._list_table(table_data)
+
+    def _emit_simple_list(self, section_data):
+        format_value = self._format_value
+        table_data = [[Paragraph('Item', self._cell_style_centered)]]
+        table_data.extend(
+            [format_value(item, is_boolean=item.__class__ is bool)] for item in section_data
+        )
+        yield from self._list_table(table_data)
+
+    def _list_table(self, table_data):
+        # List sections split the full width evenly between their columns
+        if len(table_data) > 1:
+            col_width = 7*inch / len(table_data[0])
+            yield Table(
+                table_data,
+                colWidths=[col_width] * len(table_data[0]),
+                style=self._get_table_style(has_money=False, num_rows=len(table_data)),
+                normalizedData=1
+            )
+
+    _KIND_EMITTERS = {
+        SectionKind.DAMAGE: _emit_damage_section,
+        SectionKind.KV_PLAIN: _emit_kv_plain,
+        SectionKind.KV_MONEY: _emit_kv_money,
+        SectionKind.KV_WITH_IMAGE: _emit_kv_with_image,
+        SectionKind.KV_MONEY_WITH_IMAGE: _emit_kv_money_with_image,
+        SectionKind.LIST_OF_DICTS: _emit_list_of_dicts,
+        SectionKind.SIMPLE_LIST: _emit_simple_list,
+    }
+
+    # Sections whose layout is fixed by the analysis schema (all dicts)
+    _SECTION_KINDS = {
+        'Damage Analysis': SectionKind.DAMAGE,
+        'Repair Cost Estimation (INR)': SectionKind.KV_MONEY,
+        'Market Valuation (INR)': SectionKind.KV_PLAIN,
+        'Vehicle Consistency Check': SectionKind.KV_PLAIN,
+    }
+
+    def _classify(self, report_data):
+        """Run the section layout heuristics once, up front
+        Returns (section_key, kind, section_data) for every non-empty section; kind is
+        None for sections that are neither a dict nor a list."""
+        classified = []
+        for section_key, section_data in report_data.items():
+            # Skip empty sections
+            if not section_data:
+                continue
+            if isinstance(section_data, dict):
+                kind = self._SECTION_KINDS.get(section_key)
+                if kind is None:
+                    # Check if this is a damage analysis section. Sections are uniform, so
+                    # the first value decides unless it is not a dict at all
+                    first_val = next(iter(section_data.values()))
+                    if isinstance(first_val, dict):
+                        has_damage_format = not _OBS_KEYS.isdisjoint(first_val)
                     else:
-                        # For other dictionary items, format key-value pairs
-                        item_parts = []
-                        for k, v in item.items():
-                            if isinstance(v, bool):
-                                v = "Yes" if v else "No"
-                            item_parts.append(f"{k}: {v}")
-                        formatted_items.append(", ".join(item_parts))
-                formatted = "\n".join(formatted_items)
+                        has_damage_format = any(
+                            isinstance(v, dict) and not _OBS_KEYS.isdisjoint(v)
+                            for v in section_data.values()
+                        )
+                    kind = SectionKind.DAMAGE if has_damage_format else _key_value_kind(section_key.lower())
+            elif isinstance(section_data, list):
+                if all(isinstance(item, dict) for item in section_data):
+                    kind = SectionKind.LIST_OF_DICTS
+                else:
+                    kind = SectionKind.SIMPLE_LIST
             else:
-                # For simple lists, join with commas
-                formatted = ", ".join(str(item) for item in value)
-            return Paragraph(formatted, self._get_cell_style())
-        elif isinstance(value, dict):
-            # Handle dictionary values
-            if 'Dealer' in value and 'Value' in value:
-                # Special handling for market quote dictionaries
-                formatted = f"{value['Dealer']}: Rs. {value['Value']:,}"
-            elif 'Observation' in value or 'Recommendation' in value:
-                # Return the raw dictionary for observation/recommendation pairs
-                return value
+                kind = None
+            classified.append((section_key, kind, section_data))
+        return classified
+
+    def _iter_flowables(self, report_data):
+        """Yield the report flowables section by section, starting with the header"""
+        yield from self._create_header()
+        
+        # Process each top-level key in the JSON
+        for section_key, kind, section_data in self._classify(report_data):
+            skey_l = section_key.lower()
+                
+            # Add page break before Damage Analysis section
+            if 'damage' in skey_l:
+                yield PageBreak()
+            
+            # Create section header using exact key name from JSON
+            # Special case for specific sections with reduced left indent
+            if section_key in ['Stickers and Signs Observed', 'Vehicle Dashboard and Condition']:
+                yield Paragraph(section_key, self._SPECIAL_HEADER_STYLE)
             else:
-                # For other dictionaries, format each key-value pair
-                formatted_pairs = []
-                for k, v in value.items():
-                    if isinstance(v, bool):
-                        formatted_pairs.append(f"{k}: {'Yes' if v else 'No'}")
-                    elif isinstance(v, (int, float)) and any(word in k.lower() for word in ['cost', 'price', 'value']):
-                        formatted_pairs.append(f"{k}: Rs. {v:,}")
-                    else:
-                        formatted_pairs.append(f"{k}: {v}")
-                formatted = "\n".join(formatted_pairs)
-            return Paragraph(formatted, self._get_cell_style())
-        else:
-            # Convert to string and wrap in Paragraph
-            return Paragraph(str(value), self._get_cell_style())
+                yield Paragraph(section_key, self._SECTION_HEADER_STYLE)
+            
+            flowables = [] if kind is None else list(self._KIND_EMITTERS[kind](self, section_data))
+            
+            # Space sections apart through the last table's spaceAfter; a section
+            # that produced no table still gets the gap from a Spacer
+            if flowables:
+                flowables[-1].spaceAfter = 12
+                yield from flowables
+            else:
+                yield Spacer(1, 12)
+            
+            # Add image placeholders grid after Vehicle Consistency Check section
+            if 'vehicle consistency check' in skey_l:
+                yield from self._create_image_placeholders_grid()
 
-    def generate_report(self, data, output_dir):
-        """Generate a PDF report from the analysis data"""
+    def generate_report(self, data, output_dir, filename=None):
+        """Generate a PDF report from the analysis data
+        data: Parsed analysis dict, or the raw JSON document as str/bytes
+        filename: Name of the PDF inside output_dir (defaults to a timestamped name)"""
         try:
+            if isinstance(data, (str, bytes, bytearray)):
+                data = _json_loads(data)
+
             # Get the actual data from the structure
             report_data = data.get('data', {})
             
-            # Create story (content)
-            story = []
-            self._create_header(story)
-            
-            # Process each top-level key in the JSON
-            for section_key, section_data in report_data.items():
-                # Skip empty sections
-                if not section_data:
-                    continue
-                    
-                # Add page break before Damage Analysis section
-                if 'damage' in section_key.lower():
-                    story.append(PageBreak())
-                
-                # Create section header using exact key name from JSON
-                # Special case for specific sections with reduced left indent
-                if section_key in ['Stickers and Signs Observed', 'Vehicle Dashboard and Condition']:
-                    special_header_style = ParagraphStyle(
-                        'SpecialSectionHeader',
-                        parent=self.stylesheet['Normal'],
-                        fontName='Helvetica-Bold',
-                        fontSize=10,
-                        textColor=colors.black,
-                        spaceBefore=0,
-                        spaceAfter=8,  # Increased from 4 to 8
-                        leading=12,
-                        leftIndent=8,  # Reduced indent for these specific sections
-                        firstLineIndent=0,
-                        alignment=0
-                    )
-                    story.append(Paragraph(section_key, special_header_style))
-                else:
-                    story.append(Paragraph(section_key, self.custom_styles['SectionHeader']))
-                    story.append(Spacer(1, 4))  # Add a small spacer after the header
-                
-                if isinstance(section_data, dict):
-                    # Check if this is a damage analysis section
-                    has_damage_format = any(
-                        isinstance(v, dict) and ('Observation' in v or 'Recommendation' in v)
-                        for v in section_data.values()
-                    )
-                    
-                    if has_damage_format:
-                        # Create damage analysis table with three columns
-                        table_data = [['Component', 'OBSERVATION', 'RECOMMENDATION']]
-                        for component, details in section_data.items():
-                            if isinstance(details, dict):
-                                table_data.append([
-                                    Paragraph(component, self._get_cell_style()),
-                                    Paragraph(details.get('Observation', 'N/A'), self._get_cell_style()),
-                                    Paragraph(details.get('Recommendation', 'N/A'), self._get_cell_style())
-                                ])
-                        if len(table_data) > 1:
-                            table = Table(
-                                table_data,
-                                colWidths=[2.3*inch, 2.3*inch, 2.4*inch],
-                                style=self._get_table_style(has_money=False, num_rows=len(table_data))
-                            )
-                            story.append(table)
-                    else:
-                        # Check if this is a cost/price section
-                        is_money_section = any(word in section_key.lower() for word in ['cost', 'price', 'value', 'estimation'])
-                        
-                        # Standard key-value pairs
-                        table_data = [['Parameter', 'DETAILS']]
-                        for key, value in section_data.items():
-                            # Determine if this is a boolean field
-                            is_boolean = isinstance(value, bool) or key.lower() in ['same vehicle detected']
-                            
-                            # Format the value
-                            formatted_value = self._format_value(
-                                value,
-                                align_right=is_money_section and isinstance(value, (int, float)),
-                                is_boolean=is_boolean
-                            )
-                            
-                            table_data.append([
-                                Paragraph(str(key), self._get_cell_style()),
-                                formatted_value
-                            ])
-                        
-                        if len(table_data) > 1:
-                            # Check if this section should have an image placeholder
-                            should_add_image = any(keyword in section_key.lower() for keyword in 
-                                ['vehicle details', 'vehicle dashboard', 'vehicle condition', 'stickers', 'signs'])
-                            
-                            if should_add_image:
-                                # Create a layout table with proper spacing
-                                layout_table = Table(
-                                    [[
-                                        Table(
-                                            table_data,
-                                            colWidths=[2.5*inch, 2.5*inch],
-                                            style=self._get_table_style(has_money=is_money_section, num_rows=len(table_data))
-                                        ),
-                                        Spacer(0.2*inch, 0.2*inch),
-                                        self._create_image_placeholder()
-                                    ]],
-                                    colWidths=[5*inch, 0.2*inch, 2*inch],
-                                    style=TableStyle([
-                                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                                        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                                        ('TOPPADDING', (0, 0), (-1, -1), 0),
-                                        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                                    ])
-                                )
-                                story.append(layout_table)
-                            else:
-                                # Create table with full width for sections without image placeholders
-                                table = Table(
-                                    table_data,
-                                    colWidths=[3*inch, 4*inch],
-                                    style=self._get_table_style(has_money=is_money_section, num_rows=len(table_data))
-                                )
-                                story.append(table)
-                
-                elif isinstance(section_data, list):
-                    # Handle list data
-                    if all(isinstance(item, dict) for item in section_data):
-                        # List of dictionaries (e.g., market quotes)
-                        if section_data and 'Dealer' in section_data[0]:
-                            table_data = [['Dealer', 'VALUE']]
-                            for item in section_data:
-                                table_data.append([
-                                    Paragraph(str(item.get('Dealer', 'N/A')), self._get_cell_style()),
-                                    self._format_value(item.get('Value', 0), align_right=True)
-                                ])
-                        else:
-                            # Generic list of dictionaries
-                            keys = set().union(*(d.keys() for d in section_data))
-                            table_data = [[Paragraph(k.upper(), self._get_cell_style(alignment=1)) for k in keys]]
-                            for item in section_data:
-                                row_data = []
-                                for k in keys:
-                                    value = item.get(k, 'N/A')
-                                    is_boolean = isinstance(value, bool)
-                                    row_data.append(self._format_value(value, is_boolean=is_boolean))
-                                table_data.append(row_data)
-                    else:
-                        # Simple list
-                        table_data = [[Paragraph('Item', self._get_cell_style(alignment=1))]]
-                        for item in section_data:
-                            is_boolean = isinstance(item, bool)
-                            table_data.append([self._format_value(item, is_boolean=is_boolean)])
-                    
-                    if len(table_data) > 1:
-                        col_width = 7*inch / len(table_data[0])
-                        table = Table(
-                            table_data,
-                            colWidths=[col_width] * len(table_data[0]),
-                            style=self._get_table_style(has_money=False, num_rows=len(table_data))
-                        )
-                        story.append(table)
-                
-                story.append(Spacer(1, 12))
-                
-                # Add image placeholders grid after Vehicle Consistency Check section
-                if 'vehicle consistency check' in section_key.lower():
-                    self._create_image_placeholders_grid(story)
+            # Create story (content); doc.build() pops from a list, so materialise it
+            story = list(self._iter_flowables(report_data))
             
             # Generate the PDF
-            filepath = os.path.join(output_dir, f"vehicle_damage_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
+            if filename is None:
+                filename = f"vehicle_damage_report_{_report_timestamp()}.pdf"
+            filepath = os.path.join(output_dir, filename)
+            buffer = io.BytesIO()
             doc = SimpleDocTemplate(
-                filepath,
+                buffer,
                 pagesize=A4,
                 rightMargin=25,
                 leftMargin=25,
@@ -826,7 +1026,15 @@ class VehicleDamageReportGenerator:
                 bottomMargin=45
             )
             
-            doc.build(story, onFirstPage=self._add_page_number, onLaterPages=self._add_page_number)
+            # The static footer lines are built once per report and reused on each of
+            # its pages; they are never shared with another report's build
+            add_page_number = partial(self._add_page_number, footer_lines=self._footer_lines())
+            doc.build(story, onFirstPage=add_page_number, onLaterPages=add_page_number)
+            # Write the finished PDF in one go rather than through the canvas' many small
+            # writes; getbuffer() hands the bytes over without copying them, and a write
+            # larger than the file buffer goes straight to the OS
+            with open(filepath, 'wb') as f:
+                f.write(buffer.getbuffer())
             return filepath
             
         except Exception as e:
@@ -837,58 +1045,31 @@ class VehicleDamageReportGenerator:
         """Get consistent table styling
         has_money: True if the table contains monetary values (will right-align the last column)
         num_rows: Total number of rows in the table (including header)"""
-        style = [
-            ('BACKGROUND', (0, 0), (-1, 0), self.HEADER_BG),  # Header row background (yellow)
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-            # Add visible border between headings (keep grey separator)
-            ('LINEBEFORE', (1, 0), (1, 0), 0.5, colors.HexColor('#B0B0B0')),
-            # Add yellow border around the heading row
-            ('BOX', (0, 0), (-1, 0), 1.0, self.HEADER_BG),
-            # Add grid lines for all other rows
-            ('GRID', (0, 1), (-1, -1), 0.3, colors.HexColor('#B0B0B0')),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]
-        
-        # Add alternating row colors for data rows
-        if num_rows > 1:  # Only if we have data rows
-            for i in range(1, num_rows):
-                if i % 2 == 1:  # Odd rows (1, 3, 5, etc.)
-                    style.append(('BACKGROUND', (0, i), (-1, i), self.GRAY_BG))
-        
+        style = list(self._BASE_STYLE_CMDS)
+        style.extend(_row_band_cmds(num_rows, self.GRAY_BG))
         if has_money:
             style.append(('ALIGN', (-1, 1), (-1, -1), 'RIGHT'))
             
         return TableStyle(style)
 
     def _create_image_placeholder(self, width=150, height=150):
-        # Create a rounded rectangle for the image placeholder with consistent size
-        d = Drawing(width, height)
-        
-        # Create a rounded rectangle with reduced corner radius
-        r = Rect(0, 0, width, height, rx=8, ry=8)  # Reduced corner radius from 15 to 8
-        r.fillColor = Color(0.95, 0.95, 0.95)  # Light gray background
-        r.strokeColor = Color(0.7, 0.7, 0.7)  # Gray border
-        r.strokeWidth = 1
-        
-        d.add(r)
-        
-        # Add placeholder text
-        s = String(width/2, height/2, "Image Placeholder", textAnchor="middle")
-        s.fontName = "Helvetica"
-        s.fontSize = 10
-        s.fillColor = Color(0.5, 0.5, 0.5)  # Gray text
-        d.add(s)
-        
-        return d
+        # Layout only needs the fixed size; the Drawing is built when the cell is drawn
+        return _LazyImagePlaceholder(width, height)
 
-    def _add_page_number(self, canvas, doc):
+    def _footer_lines(self):
+        # Company name, address and website, one row each in the footer
+        return [
+            [Paragraph("Sundaravijayam Automobile Services Private Limited", self._FOOTER_COMPANY_STYLE)],
+            [Paragraph("839/2, 24th Main Rd, Behind Thirumala Theatre, 1st Sector, HSR Layout, Bengaluru, Karnataka 560102",
+                       self._FOOTER_ADDRESS_STYLE)],
+            [Paragraph('<link href="https://www.readyassist.in">www.readyassist.in</link>', self._FOOTER_LINK_STYLE)],
+        ]
+
+    def _add_page_number(self, canvas, doc, footer_lines=None):
+        """Draw the page footer
+        footer_lines: Rows from _footer_lines() to reuse within one build (built fresh if omitted)"""
+        if footer_lines is None:
+            footer_lines = self._footer_lines()
         canvas.saveState()
         line_y = 0.9 * inch  # Position above the footer
         canvas.setStrokeColor(colors.HexColor('#B0B0B0'))   # Light gray color
@@ -900,63 +1081,55 @@ class VehicleDamageReportGenerator:
             [[
                 # Company info in 3 lines
                 Table(
-                    [[
-                        Paragraph(
-                            "Sundaravijayam Automobile Services Private Limited",
-                            ParagraphStyle('FooterCompany',
-                                         parent=self.stylesheet['Normal'],
-                                         fontSize=8,
-                                         fontName='Helvetica-Bold')
-                        )
-                    ],
-                    [
-                        Paragraph(
-                            "839/2, 24th Main Rd, Behind Thirumala Theatre, 1st Sector, HSR Layout, Bengaluru, Karnataka 560102",
-                            ParagraphStyle('FooterAddress',
-                                         parent=self.stylesheet['Normal'],
-                                         fontSize=8,
-                                         fontName='Helvetica',
-                                         textColor=colors.gray)
-                        )
-                    ],
-                    [
-                        Paragraph(
-                            '<link href="https://www.readyassist.in">www.readyassist.in</link>',
-                            ParagraphStyle('FooterLink',
-                                         parent=self.stylesheet['Normal'],
-                                         fontSize=8,
-                                         textColor=colors.blue,
-                                         fontName='Helvetica')
-                        )
-                    ]],
-                    style=TableStyle([
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        ('TOPPADDING', (0, 0), (-1, -1), 0),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-                    ])
+                    footer_lines,
+                    style=self._FOOTER_INNER_STYLE
                 ),
-                Paragraph(
-                    f"Page {canvas.getPageNumber()} of {doc.page}",
-                    ParagraphStyle('PageNumber',
-                                 parent=self.stylesheet['Normal'],
-                                 fontSize=8,
-                                 fontName='Helvetica',
-                                 alignment=2)  # Right alignment
-                )
+                Paragraph(f"Page {canvas.getPageNumber()} of {doc.page}", self._PAGE_NUMBER_STYLE)
             ]],
             colWidths=[5*inch, 2*inch],
-            style=TableStyle([
-                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                ('ALIGN', (-1, -1), (-1, -1), 'RIGHT'),
-                ('VALIGN', (0, 0), (-1, -1), 'BOTTOM'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 30),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 30),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ])
+            style=self._FOOTER_OUTER_STYLE
         )
         
         # Position footer at bottom of page
         footer_table.wrapOn(canvas, doc.width, doc.bottomMargin)
         footer_table.drawOn(canvas, 0, doc.bottomMargin - 40)  # Adjusted position
         canvas.restoreState()
+
+
+def generate_report(data, output_path):
+    """Generate a single report at output_path; usable as a worker process target"""
+    output_dir, filename = os.path.split(output_path)
+    return VehicleDamageReportGenerator().generate_report(data, output_dir, filename=filename)
+
+
+def _init_worker(log_level):
+    # Spawned workers start without the parent's logging setup
+    logging.basicConfig(level=log_level)
+    _ensure_fonts()
+
+
+def _worker_generate(payload):
+    data, output_path = payload
+    return generate_report(data, output_path)
+
+
+def generate_many(jobs, workers=None):
+    """Generate reports for (data, output_path) pairs in parallel worker processes
+    workers: Number of processes (defaults to the CPU count)
+    Returns the output paths in job order."""
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(logging.getLogger().getEffectiveLevel(),)) as pool:
+        futures = [pool.submit(_worker_generate, job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def generate_reports(list_of_data, output_dir, workers=None):
+    """Generate one report per analysis dict into output_dir in parallel worker processes
+    Files share one batch timestamp and are numbered in input order.
+    Returns the output paths in input order."""
+    timestamp = _report_timestamp()
+    jobs = [
+        (data, os.path.join(output_dir, f"vehicle_damage_report_{timestamp}_{index:04d}.pdf"))
+        for index, data in enumerate(list_of_data)
+    ]
+    return generate_many(jobs, workers=workers)